@@ -1,3 +1,12 @@
+import functools
+import re
+from array import array
+
+# Type checkers treat this as True; at runtime it skips importing typing and NumPy
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import numpy as np
+
 class InvalidGameError(ValueError):
     """
     Exception raised when the provided bowling game data violates the rules.
@@ -8,8 +17,100 @@ class InvalidGameError(ValueError):
     pass
 
 # Type definition for a single Frame (List of rolls as strings)
-# Utilizes Python 3.12+ type alias syntax for clarity.
-type Frame = list[str]
+# A plain alias: no TypeAliasType object or typing machinery at import time.
+Frame = list[str]
+
+# Sentinel decoded value for a spare ('/'); its pin count depends on the previous roll.
+_SPARE = -1
+
+# Lookup table decoding a normalized roll symbol to its pin count in a single step.
+# Any symbol missing from the table is invalid.
+_ROLL_VALUES: dict[str, int] = {str(pins): pins for pins in range(10)}
+_ROLL_VALUES['X'] = 10
+_ROLL_VALUES['/'] = _SPARE
+
+# --- GAME GRAMMAR ---
+# A canonical game joins each frame's normalized rolls with ',' and frames with '|',
+# e.g. [['x'], [' 7', '/']] -> 'X|7,/'. Games matching _GAME_RE are legal as-is.
+_DIGIT = '[0-9]'
+# Two-roll open frames whose pins total at most 9 (e.g. '4,5').
+_OPEN = '|'.join(f'{first},[0-{9 - first}]' for first in range(10))
+_FRAME = rf'(?:X|{_DIGIT},/|{_OPEN})'
+# A 10th frame earns bonus rolls with a strike or spare, and may still be waiting for rolls.
+_TENTH_FRAME = (
+    rf'(?:X(?:,X(?:,[X0-9])?|,{_DIGIT}(?:,/)?|,(?:{_OPEN}))?'
+    rf'|{_DIGIT},/(?:,[X0-9])?|{_OPEN}|{_DIGIT})'
+)
+# Ten frames, or up to nine where only the last may be waiting for its second roll.
+_GAME_RE = re.compile(
+    rf'(?:{_FRAME}\|){{9}}{_TENTH_FRAME}'
+    rf'|(?:(?:{_FRAME}\|){{0,8}}(?:{_FRAME}|{_DIGIT}))?'
+)
+
+# --- KNOWN GAMES ---
+# Exact inputs common in demos and tests, paired with their precomputed scores.
+# score_game and score_game_arrays answer these with a list comparison before running the pipeline.
+_KNOWN_GAMES: tuple[tuple[list[Frame], tuple[int | None, ...]], ...] = (
+    # Perfect game
+    ([['X']] * 9 + [['X', 'X', 'X']], tuple(range(30, 301, 30))),
+    # Perfect game waiting for its final bonus roll
+    ([['X']] * 9 + [['X', 'X']], tuple(range(30, 271, 30)) + (None,)),
+    # Ten single strikes: frames 9 and 10 wait for bonus rolls
+    ([['X']] * 10, tuple(range(30, 241, 30)) + (None, None)),
+    # Gutter game
+    ([['0', '0']] * 10, (0,) * 10),
+)
+
+# --- ERROR MESSAGES ---
+# Validation errors are built by these helpers so each raise site in the
+# parser's hot loop is a single call. `index` is the 0-based frame index.
+
+def _err_too_many_frames(count: int) -> InvalidGameError:
+    return InvalidGameError(f"Game cannot have more than 10 frames, got {count}")
+
+def _err_too_many_rolls(index: int, count: int, limit: int) -> InvalidGameError:
+    return InvalidGameError(f"Frame {index+1} has too many rolls ({count}). Max is {limit}.")
+
+def _err_strike_not_first(index: int) -> InvalidGameError:
+    return InvalidGameError(f"Frame {index+1}: Strike must be the first roll.")
+
+def _err_strike_extra_rolls(index: int) -> InvalidGameError:
+    return InvalidGameError(f"Frame {index+1} is a Strike but has extra rolls.")
+
+def _err_unearned_bonus() -> InvalidGameError:
+    return InvalidGameError("Frame 10: Extra roll only allowed for Strike or Spare.")
+
+def _err_invalid_roll(roll_str: str) -> InvalidGameError:
+    # Out-of-range ASCII numbers (e.g. '12', '-1') are bad pin counts. Other spellings
+    # of a legal count ('05', '+5') and non-ASCII digits ('٣') are bad symbols. The count is
+    # read off the digit string rather than int(), which rejects runs over 4300 digits.
+    negative = roll_str.startswith('-')
+    digits = roll_str[1:] if negative or roll_str.startswith('+') else roll_str
+    if digits.isascii() and digits.isdecimal():
+        magnitude = digits.lstrip('0') or '0'
+        if len(magnitude) > 1 or (negative and magnitude != '0'):
+            return InvalidGameError(f"Invalid pin count: {'-' if negative else ''}{magnitude}")
+    return InvalidGameError(
+        f"Invalid symbol found: '{roll_str}'. Valid inputs are '0'-'9', 'X', 'x', and '/'."
+    )
+
+def _err_spare_first(index: int) -> InvalidGameError:
+    return InvalidGameError(f"Frame {index+1}: Spare cannot be the first roll.")
+
+def _err_spare_after_mark(index: int, prev_symbol: str) -> InvalidGameError:
+    return InvalidGameError(f"Frame {index+1}: Spare cannot follow '{prev_symbol}'.")
+
+def _err_bonus_overflow(prev_symbol: str, roll_str: str) -> InvalidGameError:
+    return InvalidGameError(f"Frame 10: Bonus rolls '{prev_symbol}, {roll_str}' exceed 10 pins.")
+
+def _err_bonus_unmarked_spare(prev_symbol: str, roll_str: str) -> InvalidGameError:
+    return InvalidGameError(f"Frame 10: Spare '{prev_symbol}, {roll_str}' must use '/'.")
+
+def _err_unmarked_spare(index: int) -> InvalidGameError:
+    return InvalidGameError(f"Frame {index+1}: Sum is 10. You must use '/' for spares.")
+
+def _err_pin_sum(index: int, pin_sum: int) -> InvalidGameError:
+    return InvalidGameError(f"Frame {index+1}: Sum of pins {pin_sum} is invalid.")
 
 class BowlingGame:
     """
@@ -17,6 +118,9 @@ class BowlingGame:
     Supports partially complete games by returning None for future frames.
     """
 
+    # Stateless: no per-instance __dict__
+    __slots__ = ()
+
     def score_game(self, frames: list[Frame]) -> list[int | None]:
         """
         Calculates the cumulative score for a bowling game.
@@ -32,31 +136,203 @@ class BowlingGame:
             A list of exactly 10 items (integers or None). Each item represents
             the cumulative score at the end of that frame. Future frames in
             partial games are represented as None.
+
+        Raises:
+            InvalidGameError: If the game violates the rules.
+        """
+        return list(self._cached_scores(frames))
+
+    def score_game_arrays(self, frames: list[Frame]) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        Calculates the cumulative score for a game as two parallel NumPy arrays.
+
+        A structure-of-arrays alternative to `score_game` for consumers that
+        bulk-copy results (serializers, databases) and would rather not check
+        every element for None. Requires NumPy (installed with the 'jit' extra).
+
+        Args:
+            frames: A list of frames, as accepted by `score_game`.
+
+        Returns:
+            A `(scores, valid)` pair of 10-element arrays: `scores` (int16) holds
+            the cumulative score per frame, and `valid` (bool) marks the frames
+            that could be scored. Unscored frames have a score of 0.
+
+        Raises:
+            InvalidGameError: If the game violates the rules.
+        """
+        import numpy as np
+
+        cumulative_scores = self._cached_scores(frames)
+        # Scored frames form a prefix: the first None ends the scored run
+        scored = 10 - cumulative_scores.count(None)
+
+        scores = np.zeros(10, dtype=np.int16)
+        scores[:scored] = cumulative_scores[:scored]
+        valid = np.zeros(10, dtype=np.bool_)
+        valid[:scored] = True
+        return scores, valid
+
+    def score_games(self, games: list[list[Frame]]) -> list[list[int | None]]:
+        """
+        Calculates the cumulative scores for many games in one call.
+
+        Every game is validated and parsed first, then all rolls are packed
+        into one flat array and scored in a single kernel call. This amortizes
+        the per-call overhead (and JIT dispatch, when Numba is installed)
+        across the batch.
+
+        Args:
+            games: A list of games, each a list of frames as accepted by
+                   `score_game`.
+
+        Returns:
+            One list of 10 cumulative scores per game, in input order.
+
+        Raises:
+            InvalidGameError: If any game violates the rules. The message
+                              names the offending game.
+        """
+        rolls = array('b')
+        offsets = [0]
+
+        for index, frames in enumerate(games):
+            try:
+                rolls.extend(self._game_rolls(frames))
+            except InvalidGameError as error:
+                raise InvalidGameError(f"Game {index+1}: {error}") from error
+            offsets.append(len(rolls))
+
+        return _load_scorer()(rolls, offsets)
+
+    @staticmethod
+    def _cached_scores(frames: list[Frame]) -> tuple[int | None, ...]:
+        """
+        Looks up a game's cumulative scores, running the pipeline only on a miss.
+
+        Both public single-game APIs build their results from this tuple, so a
+        game is validated, parsed, and scored once whichever API asks first.
+
+        Args:
+            frames: The input list of frames.
+
+        Returns:
+            A tuple of 10 cumulative scores, with None for future frames.
+
+        Raises:
+            InvalidGameError: If the game violates the rules.
+        """
+        for known_frames, known_scores in _KNOWN_GAMES:
+            if frames == known_frames:
+                return known_scores
+
+        # Repeated games (e.g. a UI polling a game in progress) are served from the cache
+        result = _score_cached(tuple(map(tuple, frames)))
+        if isinstance(result, InvalidGameError):
+            raise InvalidGameError(*result.args)
+        return result
+
+    @staticmethod
+    def _score_uncached(frames: list[Frame]) -> list[int | None]:
+        """
+        Runs the validation, parsing, and scoring pipeline on a game.
+
+        Args:
+            frames: The input list of frames.
+
+        Returns:
+            A list of 10 cumulative scores, with None for future frames.
+
+        Raises:
+            InvalidGameError: If the game violates the rules.
+        """
+        return BowlingGame._calculate_cumulative_scores(BowlingGame._game_rolls(frames))
+
+    @staticmethod
+    def _game_rolls(frames: list[Frame]) -> array:
+        """
+        Validates a game and flattens it into integer pinfalls.
+
+        Certified games are decoded directly; anything else goes through the
+        detailed parser, which raises a descriptive error if the game is invalid.
+
+        Args:
+            frames: The input list of frames.
+
+        Returns:
+            A flat array of signed bytes, with spares converted to their remainder.
+
+        Raises:
+            InvalidGameError: If the game violates the rules.
         """
-        self._validate_structure(frames)
-        rolls = self._parse_frames_to_rolls(frames)
-        return self._calculate_cumulative_scores(rolls)
+        game = BowlingGame._validate_structure(frames)
+        if game is None:
+            return BowlingGame._parse_frames_to_rolls(frames)
+        return BowlingGame._decode_rolls(game)
 
-    def _validate_structure(self, frames: list[Frame]) -> None:
+    @staticmethod
+    def _validate_structure(frames: list[Frame]) -> str | None:
         """
         Validates the high-level structural integrity of the game input.
 
         Checks that the game does not exceed the maximum allowed length of
-        10 frames. Detailed frame-level validation occurs during parsing.
+        10 frames, then matches the canonical game string against the game
+        grammar in a single regex pass. Games the grammar rejects are left to
+        the detailed frame-level validation during parsing, which explains
+        what is wrong (or accepts the unusual shapes the grammar omits).
 
         Args:
             frames: The input list of frames to check.
 
+        Returns:
+            The canonical game string if the whole game is certified legal,
+            otherwise None.
+
         Raises:
             InvalidGameError: If the input contains more than 10 frames.
         """
         # Allow partial games (<= 10 frames)
         if len(frames) > 10:
-            raise InvalidGameError(f"Game cannot have more than 10 frames, got {len(frames)}")
+            raise _err_too_many_frames(len(frames))
+
+        game = '|'.join([','.join([r.strip().upper() for r in frame]) for frame in frames])
+
+        # Every symbol in a match is one character between separators, so a legal
+        # game of N rolls is exactly 2N - 1 characters (0 for a game with no rolls yet).
+        # Anything longer hides a separator inside a roll (e.g. '4,5') or an empty frame.
+        roll_count = sum(map(len, frames))
+        if len(game) == max(2 * roll_count - 1, 0) and _GAME_RE.fullmatch(game):
+            return game
+        return None
+
+    @staticmethod
+    def _decode_rolls(game: str) -> array:
+        """
+        Converts a certified canonical game string into a flat array of pinfalls.
+
+        Args:
+            game: A canonical game string returned by `_validate_structure`.
 
-    def _parse_frames_to_rolls(self, frames: list[Frame]) -> list[int]:
+        Returns:
+            A flat array of signed bytes, with spares converted to their remainder.
         """
-        Converts the list of string frames into a flat list of integer pinfalls.
+        # Roll symbols sit at every other character, between the separators
+        symbols = game[::2]
+        rolls = array('b', bytes(len(symbols)))
+        # Local aliases: LOAD_FAST instead of LOAD_GLOBAL per roll
+        roll_values = _ROLL_VALUES
+        spare = _SPARE
+
+        for k, symbol in enumerate(symbols):
+            val = roll_values[symbol]
+            rolls[k] = 10 - rolls[k - 1] if val == spare else val
+
+        return rolls
+
+    @staticmethod
+    def _parse_frames_to_rolls(frames: list[Frame]) -> array:
+        """
+        Converts the list of string frames into a flat array of integer pinfalls.
 
         This method also performs strict validation on a frame-by-frame basis,
         ensuring compliance with bowling rules (e.g., max 10 pins per frame,
@@ -66,103 +342,112 @@ class BowlingGame:
             frames: The raw string input frames.
 
         Returns:
-            A flat list of integers representing the number of pins knocked down
-            per ball. Spares are converted to their numeric remainder.
+            A flat array of signed bytes representing the number of pins knocked
+            down per ball. Spares are converted to their numeric remainder.
 
         Raises:
             InvalidGameError: If any frame violates bowling physics or structure.
         """
-        rolls: list[int] = []
+        # Pin counts fit in a signed byte; an unboxed array avoids one int object per slot.
+        # Preallocate the upper bound: 2 rolls per frame plus one 10th-frame bonus.
+        rolls = array('b', bytes(2 * len(frames) + 1))
+        k = 0 # Next free slot in rolls
+        # Local aliases: skip the global (and attribute) lookups per roll
+        decode = _ROLL_VALUES.get
+        spare = _SPARE
 
         for index, frame in enumerate(frames):
+            # Normalize each roll once; every check below reads these canonical symbols.
+            norm = [r.strip().upper() for r in frame]
+            has_strike = 'X' in norm
+            has_slash = '/' in norm
+
             # --- VALIDATION BLOCK ---
 
             # Rule 1: Frames 1-9 can have at most 2 rolls
             if index < 9 and len(frame) > 2:
-                 raise InvalidGameError(f"Frame {index+1} has too many rolls ({len(frame)}). Max is 2.")
+                 raise _err_too_many_rolls(index, len(frame), 2)
 
             # Rule 2: Frames 1-9, if Strike, must be the ONLY roll
-            if index < 9 and any(r.upper() == 'X' for r in frame):
+            if index < 9 and has_strike:
                 # Check position first, THEN check length.
                 # This ensures ["0", "X"] fails with "Must be first roll"
-                if frame[0].upper() != 'X':
-                    raise InvalidGameError(f"Frame {index+1}: Strike must be the first roll.")
+                if norm[0] != 'X':
+                    raise _err_strike_not_first(index)
                 if len(frame) != 1:
-                    raise InvalidGameError(f"Frame {index+1} is a Strike but has extra rolls.")
+                    raise _err_strike_extra_rolls(index)
 
             # Rule 3: 10th Frame Logic
             if index == 9:
                 if len(frame) > 3:
-                    raise InvalidGameError(f"Frame 10 has too many rolls ({len(frame)}). Max is 3.")
+                    raise _err_too_many_rolls(index, len(frame), 3)
                 # Check for "Unearned Bonus": If 3 rolls, you must have struck or spared.
                 if len(frame) == 3:
                     # It's earned if 1st is X OR 2nd is /
-                    if frame[0].upper() != 'X' and (len(frame) > 1 and frame[1] != '/'):
-                        raise InvalidGameError("Frame 10: Extra roll only allowed for Strike or Spare.")
+                    if norm[0] != 'X' and (len(frame) > 1 and norm[1] != '/'):
+                        raise _err_unearned_bonus()
 
             # --- PARSING BLOCK ---
 
             # We track the sum of pins purely for the "Law of Physics" check (Sum <= 10)
             frame_pin_sum = 0
+            # The previous roll in this frame; prev_val stays None after a mark
+            prev_symbol = None
+            prev_val = None
 
-            for i, roll_str in enumerate(frame):
-                roll_str = roll_str.strip()
-                upper_str = roll_str.upper()
+            for i, roll_str in enumerate(norm):
+                val = decode(roll_str)
 
-                if upper_str == 'X':
-                    rolls.append(10)
+                if val is None:
+                    raise _err_invalid_roll(frame[i].strip())
+
+                if val == 10:
+                    rolls[k] = 10
+                    k += 1
                     frame_pin_sum += 10 # Reset/Logic handled by complexity of 10th frame usually
 
-                elif roll_str == '/':
+                elif val == spare:
                     if i == 0:
-                         raise InvalidGameError(f"Frame {index+1}: Spare cannot be the first roll.")
+                         raise _err_spare_first(index)
 
                     # You cannot Spare if the previous roll was X or /
-                    prev_symbol = frame[i-1].strip().upper()
-                    if prev_symbol == 'X' or prev_symbol == '/':
-                        raise InvalidGameError(f"Frame {index+1}: Spare cannot follow '{prev_symbol}'.")
+                    if prev_val is None:
+                        raise _err_spare_after_mark(index, prev_symbol)
 
-                    previous_roll = rolls[-1]
-                    rolls.append(10 - previous_roll)
+                    rolls[k] = 10 - prev_val
+                    k += 1
                     frame_pin_sum = 10 # A spare completes the 10 count
                 else:
-                    try:
-                        val = int(roll_str)
-                    except ValueError:
-                        raise InvalidGameError(
-                            f"Invalid symbol found: '{roll_str}'. Valid inputs are '0'-'9', 'X', 'x', and '/'."
-                        )
-
-                    if val < 0 or val > 9:
-                        raise InvalidGameError(f"Invalid pin count: {val}")
-
                     # Rule 4: 10th Frame Logic for consecutive open pins
                     # (e.g., checks against 'X, 5, 6' or '5, 5' without slash)
-                    if index == 9 and i > 0:
-                         prev_roll = frame[i-1]
-                         # If previous roll was also a number (not a mark), check their sum
-                         if prev_roll.isdigit():
-                             prev_val = int(prev_roll)
-                             if prev_val + val > 10:
-                                 raise InvalidGameError(f"Frame 10: Bonus rolls '{prev_roll}, {roll_str}' exceed 10 pins.")
-                             if prev_val + val == 10:
-                                 raise InvalidGameError(f"Frame 10: Spare '{prev_roll}, {roll_str}' must use '/'.")
-
-                    rolls.append(val)
+                    # If previous roll was also a number (not a mark), check their sum
+                    if index == 9 and prev_val is not None:
+                        if prev_val + val > 10:
+                            raise _err_bonus_overflow(prev_symbol, roll_str)
+                        if prev_val + val == 10:
+                            raise _err_bonus_unmarked_spare(prev_symbol, roll_str)
+
+                    rolls[k] = val
+                    k += 1
                     frame_pin_sum += val
 
                     # Rule 5: "Law of Physics" - Open Frames cannot exceed 9.
                     # If they equal 10, they should be '/', if > 10, it's impossible.
                     # We only check this if NOT a strike (which resets logic) and NOT a spare (which fixes sum to 10)
-                    if index < 9 and i == 1 and 'X' not in [r.upper() for r in frame] and '/' not in frame:
+                    if index < 9 and i == 1 and not has_strike and not has_slash:
                         if frame_pin_sum == 10:
-                            raise InvalidGameError(f"Frame {index+1}: Sum is 10. You must use '/' for spares.")
+                            raise _err_unmarked_spare(index)
                         elif frame_pin_sum > 10:
-                            raise InvalidGameError(f"Frame {index+1}: Sum of pins {frame_pin_sum} is invalid.")
+                            raise _err_pin_sum(index, frame_pin_sum)
 
-        return rolls
+                # Carry this roll forward for the next roll's spare and bonus checks
+                prev_symbol = roll_str
+                prev_val = val if 0 <= val <= 9 else None
+
+        return rolls[:k]
 
-    def _calculate_cumulative_scores(self, rolls: list[int]) -> list[int | None]:
+    @staticmethod
+    def _calculate_cumulative_scores(rolls: array) -> list[int | None]:
         """
         Calculates the running total score for each frame.
 
@@ -172,55 +457,177 @@ class BowlingGame:
         - Strike: 10 + next 2 rolls.
 
         Args:
-            rolls: A flat list of integer pinfalls.
+            rolls: A flat array of integer pinfalls.
 
         Returns:
             A list of 10 cumulative scores. If a frame cannot be calculated
             due to insufficient data (partial game), its score is None.
         """
-        # Initialize results with None
+        # Single games stay interpreted: JIT warmup would dwarf a 10-frame loop
         cumulative_scores: list[int | None] = [None] * 10
         running_total = 0
         roll_index = 0
+        roll_count = len(rolls)
 
         for frame in range(10):
             # If we don't even have a roll for this frame start, we are done
-            if roll_index >= len(rolls):
+            if roll_index >= roll_count:
                 break
 
             current_roll = rolls[roll_index]
-            frame_score = 0
 
             # Logic: Check if we have enough data to score this frame.
             # If not, we break (leaving this and future frames as None).
 
             if current_roll == 10: # Strike
                 # We need the strike (1) + 2 bonus rolls
-                if roll_index + 2 >= len(rolls):
+                if roll_index + 2 >= roll_count:
                     break # Not enough data yet
 
-                frame_score = 10 + rolls[roll_index + 1] + rolls[roll_index + 2]
+                running_total += 10 + rolls[roll_index + 1] + rolls[roll_index + 2]
                 roll_index += 1 # Advance 1 position
 
             else: # Open or Spare
                 # We need at least 2 rolls for the frame itself
-                if roll_index + 1 >= len(rolls):
+                if roll_index + 1 >= roll_count:
                     break # waiting for second roll of frame
 
-                second_roll = rolls[roll_index + 1]
+                frame_pins = current_roll + rolls[roll_index + 1]
 
-                if current_roll + second_roll == 10: # Spare
+                if frame_pins == 10: # Spare
                     # We need the 2 frame rolls + 1 bonus roll
-                    if roll_index + 2 >= len(rolls):
+                    if roll_index + 2 >= roll_count:
                         break # waiting for bonus roll
 
-                    frame_score = 10 + rolls[roll_index + 2]
-                    roll_index += 2
+                    running_total += 10 + rolls[roll_index + 2]
                 else: # Open Frame
-                    frame_score = current_roll + second_roll
-                    roll_index += 2
+                    running_total += frame_pins
+
+                roll_index += 2 # Advance 2 positions
 
-            running_total += frame_score
             cumulative_scores[frame] = running_total
 
-        return cumulative_scores
\ No newline at end of file
+        return cumulative_scores
+
+def _score_kernel(rolls, offsets, scores, counts) -> None:
+    """
+    Writes the cumulative score of each completed frame, for a batch of games.
+
+    Written in the subset of Python that Numba compiles; `score_games` runs it
+    JIT-compiled. Without Numba, `_score_batch` loops over the interpreted
+    single-game scorer instead, which is faster than this kernel uncompiled.
+
+    Args:
+        rolls: The flat pinfalls of every game, back to back.
+        offsets: Game boundaries; game g owns rolls[offsets[g]:offsets[g + 1]].
+        scores: One 10-slot output row per game; only scored frames are written.
+        counts: Receives the number of frames scored per game. Later frames
+                lack data (partial game).
+    """
+    for game in range(len(counts)):
+        start = offsets[game]
+        stop = offsets[game + 1]
+        row = scores[game]
+        running_total = 0
+        roll_index = start
+        scored = 0
+
+        # Same branching as _calculate_cumulative_scores, stopping at the first frame
+        # missing its own rolls or its bonus. It and all future frames stay unscored.
+        while scored < 10 and roll_index < stop:
+            current_roll = rolls[roll_index]
+
+            if current_roll == 10: # Strike
+                if roll_index + 2 >= stop:
+                    break
+                running_total += 10 + rolls[roll_index + 1] + rolls[roll_index + 2]
+                roll_index += 1
+            else: # Open or Spare
+                if roll_index + 1 >= stop:
+                    break
+                frame_pins = current_roll + rolls[roll_index + 1]
+                if frame_pins == 10: # Spare
+                    if roll_index + 2 >= stop:
+                        break
+                    running_total += 10 + rolls[roll_index + 2]
+                else: # Open Frame
+                    running_total += frame_pins
+                roll_index += 2
+
+            row[scored] = running_total
+            scored += 1
+
+        counts[game] = scored
+
+def _score_batch(rolls: array, offsets: list[int]) -> list[list[int | None]]:
+    """
+    Scores a batch of games with the interpreted single-game scorer.
+
+    Args:
+        rolls: The flat pinfalls of every game, back to back.
+        offsets: Game boundaries, starting at 0 and ending at len(rolls).
+
+    Returns:
+        One list of 10 cumulative scores per game, with None for unscored frames.
+    """
+    score = BowlingGame._calculate_cumulative_scores
+    return [score(rolls[start:stop]) for start, stop in zip(offsets, offsets[1:])]
+
+@functools.cache
+def _load_scorer():
+    """
+    Returns the fastest available batch scorer for `score_games`.
+
+    NumPy and Numba are optional and imported on first use, so importing
+    kingpin stays dependency-free. When Numba is installed the kernel is
+    JIT-compiled (and cached on disk); otherwise, or if compilation fails,
+    the interpreted scorer is used. JIT dispatch only pays off when many
+    games are scored at once, so single-game scoring never comes here.
+    """
+    # Numba first: without it there is no reason to pay for importing NumPy
+    try:
+        from numba import njit
+    except ImportError:
+        return _score_batch
+
+    import numpy as np
+
+    try:
+        # An explicit signature compiles (or loads from the disk cache) right now,
+        # so a broken toolchain falls back here instead of failing mid-batch.
+        kernel = njit('void(int8[::1], int32[::1], int16[:, ::1], int8[::1])', cache=True)(_score_kernel)
+    except Exception:
+        return _score_batch
+
+    def score_batch_jit(rolls: array, offsets: list[int]) -> list[list[int | None]]:
+        game_count = len(offsets) - 1
+        scores = np.empty((game_count, 10), dtype=np.int16)
+        counts = np.empty(game_count, dtype=np.int8)
+        kernel(np.frombuffer(rolls, dtype=np.int8), np.array(offsets, dtype=np.int32), scores, counts)
+        return [
+            row[:scored] + [None] * (10 - scored)
+            for row, scored in zip(scores.tolist(), counts.tolist())
+        ]
+
+    return score_batch_jit
+
+@functools.lru_cache(maxsize=4096)
+def _score_cached(key: tuple[tuple[str, ...], ...]) -> tuple[int | None, ...] | InvalidGameError:
+    """
+    Memoizes the scoring pipeline by game.
+
+    Invalid games are cached as their error, so known-bad input is not
+    re-validated either. The error is stored without its traceback, which
+    would otherwise keep the pipeline's frames and locals alive. Results are
+    tuples so cached entries cannot be mutated.
+
+    Args:
+        key: The game's frames as a tuple of tuples of rolls.
+
+    Returns:
+        The 10 cumulative scores, or the InvalidGameError the game raised.
+    """
+    try:
+        return tuple(BowlingGame._score_uncached(key))
+    except InvalidGameError as error:
+        return error.with_traceback(None)
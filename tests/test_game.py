@@ -1,10 +1,29 @@
+import sys
+from array import array
+
 import pytest
+from kingpin import game as game_module
 from kingpin.game import BowlingGame, InvalidGameError
 
 @pytest.fixture
 def game():
-    """Fixture to provide a fresh game instance for each test."""
-    return BowlingGame()
+    """Fixture to provide a fresh game instance (and empty result caches) for each test."""
+    game_module._score_cached.cache_clear()
+    yield BowlingGame()
+    game_module._score_cached.cache_clear()
+
+@pytest.fixture(params=["default", "interpreted"])
+def batch_game(request, monkeypatch, game):
+    """
+    Fixture for batch scoring tests.
+    Runs each test against the default batch scorer (JIT-compiled when Numba is installed)
+    and against the interpreted fallback used when it is missing.
+    """
+    if request.param == "interpreted":
+        monkeypatch.setitem(sys.modules, "numba", None)
+    game_module._load_scorer.cache_clear()
+    yield game
+    game_module._load_scorer.cache_clear()
 
 def _verify_score(game, frames, expected, scenario_name=None):
     """
@@ -31,7 +50,8 @@ def test_document_example_game(game):
 
 # --- PARAMETERIZED SCORING SUITE ---
 
-@pytest.mark.parametrize("name, frames, expected", [
+# Legal games with their expected cumulative scores, shared by the scoring and grammar tests.
+SCORING_SCENARIOS = [
     (
         "Gutter Game",
         [["0", "0"]] * 10,
@@ -134,34 +154,62 @@ def test_document_example_game(game):
         [["\tX\n"], [" 5", "4\t"]] + [["0", "0"]] * 8,
         [19, 28] + [28] * 8
     ),
+    (
+        "Padded 10th Frame Strike",
+        # The padded strike earns its bonus rolls like a bare 'X'
+        [["X"]] * 9 + [[" x ", "2", "3"]],
+        [30, 60, 90, 120, 150, 180, 210, 240, 262, 277]
+    ),
 
-])
+]
+
+@pytest.mark.parametrize("name, frames, expected", SCORING_SCENARIOS)
 def test_scoring_scenarios(game, name, frames, expected):
     """
     Covers Standard, Edge, and Partial scoring scenarios using the shared verification logic.
     """
     _verify_score(game, frames, expected, name)
 
+@pytest.mark.parametrize("name, frames, expected", SCORING_SCENARIOS)
+def test_grammar_certifies_scoring_scenarios(name, frames, expected):
+    """
+    Verifies the game grammar certifies every legal scenario, and its fast decode matches the parser.
+    """
+    canonical = BowlingGame._validate_structure(frames)
+    assert canonical is not None, f"Not certified: {name}"
+    assert BowlingGame._decode_rolls(canonical) == BowlingGame._parse_frames_to_rolls(frames), name
+
 # --- PARAMETERIZED VALIDATION SUITE ---
 
 @pytest.mark.parametrize("name, frames, match_string", [
     ("Spare at start", [["/", "5"]], "Spare cannot be the first roll"),
     ("Invalid character", [["A", "0"]], "Invalid symbol"),
+    ("Two rolls in one string", [["5,4"]], "Invalid symbol"),
     ("Too many frames", [["0", "0"]] * 11, "more than 10 frames"),
     ("Frame sum > 10", [["5", "6"]], "Sum of pins"),
     ("Frame sum = 10 (no /)", [["5", "5"]], "must use '/'"),
     ("Strike with extra roll", [["X", "2"]], "Strike but has extra rolls"),
     ("Strike as 2nd roll", [["0", "X"]], "Strike must be the first roll"),
+    ("Strike as 2nd roll (Padded)", [["5", " X"]], "Strike must be the first roll"),
+    ("Strike with extra roll (Padded)", [[" X", "1"]], "Strike but has extra rolls"),
     ("Normal frame too many rolls", [["3", "3", "3"]], "too many rolls"),
     ("10th Frame unearned bonus", [["X"]] * 9 + [["5", "3", "1"]], "Extra roll only allowed"),
     ("10th Frame too many rolls", [["X"]] * 9 + [["X", "X", "X", "X"]], "Frame 10 has too many rolls"),
     ("10th Frame Impossible Bonus (5+6)", [["X"]] * 9 + [["X", "5", "6"]], "exceed 10 pins"),
+    ("10th Frame Impossible Bonus (Padded)", [["X"]] * 9 + [["X", " 5", "6 "]], "exceed 10 pins"),
     ("10th Frame Notation (5+5)", [["X"]] * 9 + [["X", "5", "5"]], "must use '/'"),
     ("10th Frame Spare after Strike", [["X"]] * 9 + [["X", "/", "X"]], "Spare cannot follow"),
     ("10th Frame Double Spare", [["X"]] * 9 + [["5", "/", "/"]], "Spare cannot follow"),
     ("10th Frame Spare after Two Strikes", [["X"]] * 9 + [["X", "X", "/"]], "Spare cannot follow"),
     ("Negative pins", [["-1", "0"]], "Invalid pin count"),
     ("Pin count > 9", [["12", "0"]], "Invalid pin count"),
+    ("Zero-padded pin count", [["05", "0"]], "Invalid symbol found: '05'"),
+    ("Signed pin count", [["+5", "0"]], "Invalid symbol found: '+5'"),
+    ("Signed pin count > 9", [["+12", "0"]], "Invalid pin count: 12"),
+    ("Zero-padded negative pins", [["-05", "0"]], "Invalid pin count: -5"),
+    ("Huge pin count", [["9" * 5000, "0"]], "Invalid pin count: 999"),
+    ("Non-ASCII digit", [["٣", "0"]], "Invalid symbol found: '٣'"),
+    ("Non-ASCII number > 9", [["١٢", "0"]], "Invalid symbol found: '١٢'"),
 ])
 def test_validation_logic(game, name, frames, match_string):
     """
@@ -169,4 +217,152 @@ def test_validation_logic(game, name, frames, match_string):
     """
     with pytest.raises(InvalidGameError) as excinfo:
         game.score_game(frames)
-    assert match_string in str(excinfo.value), f"Failed Scenario: {name}"
\ No newline at end of file
+    assert match_string in str(excinfo.value), f"Failed Scenario: {name}"
+
+# --- MEMOIZATION ---
+
+def test_repeated_games_are_memoized(game):
+    """
+    Verifies repeated games are served from the cache without sharing state between callers.
+    """
+    frames = [["X"], ["5", "/"], ["X"]]
+    first = game.score_game(frames)
+    first[0] = 0 # Callers own their result list
+
+    _verify_score(game, frames, [20, 40] + [None] * 8, "Cached Partial Game")
+    assert game_module._score_cached.cache_info().hits == 1
+
+def test_repeated_invalid_games_raise(game):
+    """
+    Verifies cached invalid games are not re-validated, yet raise a fresh InvalidGameError on every call.
+    """
+    for _ in range(2):
+        with pytest.raises(InvalidGameError, match="Spare cannot be the first roll"):
+            game.score_game([["/", "5"]])
+
+    cache_info = game_module._score_cached.cache_info()
+    assert (cache_info.misses, cache_info.hits) == (1, 1)
+    # The cached error must not pin the pipeline's frames in memory
+    assert game_module._score_cached((("/", "5"),)).__traceback__ is None
+
+# --- BATCH SCORING ---
+
+def test_batch_scoring(batch_game):
+    """
+    Verifies a batch of complete, partial and empty games scores like individual calls.
+    """
+    games = [
+        [["8", "/"], ["5", "4"], ["9", "0"], ["X"], ["X"],
+         ["5", "/"], ["5", "3"], ["6", "3"], ["9", "/"], ["9", "/", "X"]],
+        [["X"]] * 9 + [["X", "X", "X"]],
+        [],
+        [["X"], ["5", "4"], ["X"]],
+        [["5", "/"]],
+    ]
+    expected = [
+        [15, 24, 33, 58, 78, 93, 101, 110, 129, 149],
+        [30, 60, 90, 120, 150, 180, 210, 240, 270, 300],
+        [None] * 10,
+        [19, 28] + [None] * 8,
+        [None] * 10,
+    ]
+    assert batch_game.score_games(games) == expected
+    assert batch_game.score_games([]) == []
+
+def test_batch_scoring_names_invalid_game(batch_game):
+    """
+    Verifies an invalid game in a batch raises InvalidGameError identifying that game.
+    """
+    with pytest.raises(InvalidGameError, match="Game 2: Frame 1: Spare cannot be the first roll"):
+        batch_game.score_games([[["5", "4"]], [["/", "5"]]])
+
+def test_batch_scoring_survives_jit_failure(game, monkeypatch):
+    """
+    Verifies batch scoring falls back to the interpreted scorer when Numba cannot compile the kernel.
+    """
+    numba = pytest.importorskip("numba")
+
+    def broken_njit(*args, **kwargs):
+        raise RuntimeError("no compiler available")
+
+    monkeypatch.setattr(numba, "njit", broken_njit)
+    game_module._load_scorer.cache_clear()
+    try:
+        assert game.score_games([[["X"], ["5", "4"]]]) == [[19, 28] + [None] * 8]
+        assert game_module._load_scorer() is game_module._score_batch
+    finally:
+        game_module._load_scorer.cache_clear()
+
+def test_batch_kernel_matches_interpreted_scorer():
+    """
+    Verifies the Numba kernel, run as plain Python, scores like the interpreted single-game scorer.
+    """
+    games = [
+        [10, 7, 3, 9, 0, 10, 0, 8, 8, 2, 0, 6, 10, 10, 10, 8, 1],
+        [10] * 12,
+        [],
+        [10, 5, 4, 10],
+        [5, 5],
+        [3],
+    ]
+    rolls = array("b", [pins for game_rolls in games for pins in game_rolls])
+    offsets = [0]
+    for game_rolls in games:
+        offsets.append(offsets[-1] + len(game_rolls))
+    scores = [[None] * 10 for _ in games]
+    counts = [0] * len(games)
+
+    game_module._score_kernel(rolls, offsets, scores, counts)
+
+    assert scores == [BowlingGame._calculate_cumulative_scores(array("b", g)) for g in games]
+    assert counts == [10, 10, 0, 2, 0, 0]
+
+# --- KNOWN GAME SHORTCUTS ---
+
+@pytest.mark.parametrize("frames, expected", game_module._KNOWN_GAMES)
+def test_known_games_match_pipeline(frames, expected):
+    """
+    Verifies every precomputed shortcut agrees with the full scoring pipeline.
+    """
+    assert tuple(BowlingGame._score_uncached(frames)) == expected
+
+# --- ARRAY RESULTS ---
+
+def test_score_game_arrays(game):
+    """
+    Verifies the (scores, valid) array pair mirrors score_game, with 0 for unscored frames.
+    """
+    np = pytest.importorskip("numpy")
+    scores, valid = game.score_game_arrays([["X"], ["5", "4"], ["X"]])
+
+    assert scores.dtype == np.int16 and valid.dtype == np.bool_
+    assert scores.tolist() == [19, 28] + [0] * 8
+    assert valid.tolist() == [True, True] + [False] * 8
+
+    scores, valid = game.score_game_arrays([])
+    assert not valid.any() and not scores.any()
+
+def test_score_game_arrays_cached(game):
+    """
+    Verifies arrays share score_game's cache and known-game shortcuts, and callers own their arrays.
+    """
+    pytest.importorskip("numpy")
+    frames = [["X"], ["5", "/"], ["X"]]
+    assert game.score_game(frames) == [20, 40] + [None] * 8
+    scores, valid = game.score_game_arrays(frames)
+    scores[0] = 0 # Callers own their arrays
+
+    scores, valid = game.score_game_arrays(frames)
+    assert scores.tolist() == [20, 40] + [0] * 8
+    assert valid.tolist() == [True, True] + [False] * 8
+    cache_info = game_module._score_cached.cache_info()
+    assert (cache_info.misses, cache_info.hits) == (1, 2)
+
+    scores, valid = game.score_game_arrays([["X"]] * 10)
+    assert scores.tolist() == list(range(30, 241, 30)) + [0, 0]
+    assert valid.tolist() == [True] * 8 + [False] * 2
+    assert game_module._score_cached.cache_info().misses == 1
+
+    for _ in range(2):
+        with pytest.raises(InvalidGameError, match="Spare cannot be the first roll"):
+            game.score_game_arrays([["/", "5"]])